@@ -5,10 +5,13 @@ from app.window import MainWindow
 
 
 def _patch_path() -> None:
-    extra = ["/opt/homebrew/bin", "/usr/local/bin"]
+    # Use os.pathsep (':' vs ';') and split PATH once, not per candidate.
+    sep = os.pathsep
     cur = os.environ.get("PATH", "")
-    parts = [p for p in extra if p and p not in cur.split(":")]
-    os.environ["PATH"] = ":".join(parts + [cur]) if cur else ":".join(parts)
+    cur_parts = cur.split(sep) if cur else []
+    cur_set = set(cur_parts)
+    new = [p for p in ("/opt/homebrew/bin", "/usr/local/bin") if p not in cur_set]
+    os.environ["PATH"] = sep.join(new + cur_parts)
 
 
 def main() -> int:
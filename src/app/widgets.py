@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Union
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -25,6 +25,9 @@ class PathListWidget(QListWidget):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        # Mirrors the item texts so dedupe on a drop is O(1) per path
+        # instead of rescanning every row.
+        self._known: set[str] = set()
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         if event.mimeData().hasUrls():
@@ -38,39 +41,46 @@ class PathListWidget(QListWidget):
             for url in event.mimeData().urls():
                 p = url.toLocalFile()
                 if p:
-                    paths.append(Path(p))
+                    paths.append(p)
             self.add_paths(paths)
             event.acceptProposedAction()
             return
         super().dropEvent(event)
 
-    def add_paths(self, paths: Iterable[Path]) -> None:
-        existing = set(self.get_paths())
+    def add_paths(self, paths: Iterable[Union[str, Path]]) -> None:
         changed = False
-        for p in paths:
-            p = Path(p)
-            if p in existing:
-                continue
-            self.addItem(QListWidgetItem(str(p)))
-            existing.add(p)
-            changed = True
+        self.setUpdatesEnabled(False)
+        try:
+            for p in paths:
+                p = Path(p)
+                s = str(p)
+                if s in self._known:
+                    continue
+                item = QListWidgetItem(s)
+                # Keep the Path on the item so get_paths never has to
+                # reconstruct one per row.
+                item.setData(Qt.UserRole, p)
+                self.addItem(item)
+                self._known.add(s)
+                changed = True
+        finally:
+            self.setUpdatesEnabled(True)
         if changed:
             self.changed.emit()
 
     def remove_selected(self) -> None:
         for item in self.selectedItems():
+            self._known.discard(item.text())
             self.takeItem(self.row(item))
         self.changed.emit()
 
     def clear_all(self) -> None:
         self.clear()
+        self._known.clear()
         self.changed.emit()
 
     def get_paths(self) -> list[Path]:
-        out: list[Path] = []
-        for i in range(self.count()):
-            out.append(Path(self.item(i).text()))
-        return out
+        return [self.item(i).data(Qt.UserRole) for i in range(self.count())]
 
 
 class LogBox(QPlainTextEdit):
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Callable, Optional
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QThread, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QFormLayout,
@@ -18,8 +22,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QSpinBox,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QCheckBox,
@@ -36,6 +39,36 @@ class ProgressEvent:
     message: str
 
 
+class ProgressThrottle:
+    """Coalesces worker progress into at most ~30 emits per second.
+
+    With a worker pool and hundreds of files, emitting one cross-thread
+    Qt signal per update saturates the UI thread's event queue. Dropped
+    updates lose nothing: the bar only needs the latest position, and
+    log messages are queued and flushed with the next allowed emit (the
+    final update always goes through).
+    """
+
+    def __init__(self, emit: Callable[[ProgressEvent], None], interval: float = 1 / 30) -> None:
+        self._emit = emit
+        self._interval = interval
+        self._last = 0.0
+        self._pending: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, done: int, total: int, message: str = "") -> None:
+        with self._lock:
+            if message:
+                self._pending.append(message)
+            now = time.monotonic()
+            if done < total and now - self._last < self._interval:
+                return
+            self._last = now
+            text = "\n".join(self._pending)
+            self._pending.clear()
+        self._emit(ProgressEvent(done, total, text))
+
+
 class Worker(QObject):
     progressed = Signal(object)
     finished = Signal(object, object)
@@ -61,8 +94,11 @@ class JobController(QObject):
         self._thread: Optional[QThread] = None
         self._worker: Optional[Worker] = None
 
-    def start(self, fn: Callable[[], object]) -> None:
-        self.stop()
+    def start(self, fn: Callable[[], object]) -> bool:
+        if not self.stop():
+            # Previous job is still running; refuse rather than drop
+            # the last reference to a live QThread.
+            return False
         t = QThread()
         w = Worker(fn)
         w.moveToThread(t)
@@ -75,12 +111,77 @@ class JobController(QObject):
         self._thread = t
         self._worker = w
         t.start()
+        return True
 
-    def stop(self) -> None:
-        if self._thread is not None:
+    def stop(self) -> bool:
+        if self._thread is None:
+            return True
+        try:
+            # quit() only asks the event loop to exit; without wait()
+            # the QThread (and the worker's object graph) leaks every
+            # time a new job starts over an old one.
             self._thread.quit()
+            if not self._thread.wait(2000):
+                # Still running: releasing the references here would
+                # let Qt destroy a live QThread and abort the app.
+                return False
+        except RuntimeError:
+            # The C++ object was already deleted via deleteLater after
+            # the job finished; nothing left to wait for.
+            pass
         self._thread = None
         self._worker = None
+        return True
+
+
+class AudioInfoModel(QAbstractTableModel):
+    """Read-only table model over probe results.
+
+    Cells are rendered lazily out of the AudioInfo list, so populating
+    the table is a single model reset instead of one QTableWidgetItem
+    per cell.
+    """
+
+    _HEADERS = ["File", "Duration (s)", "Sample Rate", "Channels", "Codec", "Bitrate"]
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._infos: list[core.AudioInfo] = []
+
+    def set_infos(self, infos: list[core.AudioInfo]) -> None:
+        self.beginResetModel()
+        self._infos = list(infos)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._infos)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        info = self._infos[index.row()]
+        col = index.column()
+        if col == 0:
+            return info.path.name
+        if col == 1:
+            return f"{info.duration_s:.3f}"
+        if col == 2:
+            return "" if info.sample_rate is None else str(info.sample_rate)
+        if col == 3:
+            return "" if info.channels is None else str(info.channels)
+        if col == 4:
+            return "" if info.codec is None else str(info.codec)
+        if col == 5:
+            return "" if info.bit_rate is None else str(info.bit_rate)
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole) -> object:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
 
 
 class ProbeTab(QWidget):
@@ -96,8 +197,9 @@ class ProbeTab(QWidget):
         self.progress.setValue(0)
         self.logbox = LogBox()
 
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["File", "Duration (s)", "Sample Rate", "Channels", "Codec", "Bitrate"])
+        self.model = AudioInfoModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         btns = QHBoxLayout()
         btns.addWidget(self.btn_probe)
@@ -120,7 +222,7 @@ class ProbeTab(QWidget):
 
     def _add_files(self) -> None:
         files, _ = QFileDialog.getOpenFileNames(self, "Select audio files")
-        self.inputs.list.add_paths([Path(f) for f in files])
+        self.inputs.list.add_paths(files)
 
     def _on_progress(self, ev: object) -> None:
         e: ProgressEvent = ev
@@ -134,17 +236,7 @@ class ProbeTab(QWidget):
             return
 
         infos: list[core.AudioInfo] = result
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(infos))
-
-        for i, info in enumerate(infos):
-            self.table.setItem(i, 0, QTableWidgetItem(str(info.path.name)))
-            self.table.setItem(i, 1, QTableWidgetItem(f"{info.duration_s:.3f}"))
-            self.table.setItem(i, 2, QTableWidgetItem("" if info.sample_rate is None else str(info.sample_rate)))
-            self.table.setItem(i, 3, QTableWidgetItem("" if info.channels is None else str(info.channels)))
-            self.table.setItem(i, 4, QTableWidgetItem("" if info.codec is None else str(info.codec)))
-            self.table.setItem(i, 5, QTableWidgetItem("" if info.bit_rate is None else str(info.bit_rate)))
-
+        self.model.set_infos(infos)
         self.logbox.log("Done")
 
     def _run(self) -> None:
@@ -154,19 +246,26 @@ class ProbeTab(QWidget):
             return
 
         self.progress.setValue(0)
-        self.table.setRowCount(0)
+        self.model.set_infos([])
         self.logbox.log("Probing...")
 
         def fn() -> object:
-            out: list[core.AudioInfo] = []
             total = len(paths)
-            for idx, p in enumerate(paths, start=1):
-                info = core.probe_file(p)
-                out.append(info)
-                self.controller.progressed.emit(ProgressEvent(idx, total, f"{idx}/{total} Probed {p.name}"))
+            out: list[Optional[core.AudioInfo]] = [None] * total
+            progress = ProgressThrottle(self.controller.progressed.emit)
+            # Fan the files out over a pool so one slow probe does not
+            # stall the rest; results land back in input order.
+            workers = min(total, os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {ex.submit(core.probe_file, p): (i, p) for i, p in enumerate(paths)}
+                for done, fut in enumerate(as_completed(futures), start=1):
+                    i, p = futures[fut]
+                    out[i] = fut.result()
+                    progress(done, total, f"{done}/{total} Probed {p.name}")
             return out
 
-        self.controller.start(fn)
+        if not self.controller.start(fn):
+            self.logbox.log("A job is already running; wait for it to finish.")
 
 
 class ConvertTab(QWidget):
@@ -236,7 +335,7 @@ class ConvertTab(QWidget):
 
     def _add_files(self) -> None:
         files, _ = QFileDialog.getOpenFileNames(self, "Select audio files")
-        self.inputs.list.add_paths([Path(f) for f in files])
+        self.inputs.list.add_paths(files)
 
     def _choose_out_dir(self) -> None:
         d = QFileDialog.getExistingDirectory(self, "Select output folder")
@@ -247,7 +346,8 @@ class ConvertTab(QWidget):
         e: ProgressEvent = ev
         if e.total > 0:
             self.progress.setValue(int((e.done * 100) / e.total))
-        self.logbox.log(e.message)
+        if e.message:
+            self.logbox.log(e.message)
 
     def _on_finished(self, result: object, error: object) -> None:
         if error is not None:
@@ -282,15 +382,44 @@ class ConvertTab(QWidget):
         self.logbox.log("Converting...")
 
         def fn() -> object:
-            outs: list[Path] = []
             total = len(paths)
-            for idx, p in enumerate(paths, start=1):
-                outp = core.convert_file(p, opts)
-                outs.append(outp)
-                self.controller.progressed.emit(ProgressEvent(idx, total, f"{idx}/{total} Converted {p.name}"))
-            return outs
+            # Probe first (served by the probe cache) so progress can be
+            # weighted by duration and tick within long files.
+            durations_us = [int(i.duration_s * 1_000_000) for i in core.probe_files(paths)]
+            total_us = sum(durations_us) or 1
+            out: list[Optional[Path]] = [None] * total
+            progress_us = [0] * total
+            lock = threading.Lock()
+            progress = ProgressThrottle(self.controller.progressed.emit)
+
+            def make_cb(i: int) -> Callable[[int], None]:
+                cap = durations_us[i]
+
+                def cb(us: int) -> None:
+                    with lock:
+                        progress_us[i] = min(us, cap)
+                        done_us = sum(progress_us)
+                    progress(done_us, total_us)
+
+                return cb
+
+            workers = min(total, os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {
+                    ex.submit(core.convert_file, p, replace(opts, progress_cb=make_cb(i))): (i, p)
+                    for i, p in enumerate(paths)
+                }
+                for done, fut in enumerate(as_completed(futures), start=1):
+                    i, p = futures[fut]
+                    out[i] = fut.result()
+                    with lock:
+                        progress_us[i] = durations_us[i]
+                        done_us = sum(progress_us)
+                    progress(done_us, total_us, f"{done}/{total} Converted {p.name}")
+            return out
 
-        self.controller.start(fn)
+        if not self.controller.start(fn):
+            self.logbox.log("A job is already running; wait for it to finish.")
 
 
 class MainWindow(QMainWindow):
@@ -298,13 +427,30 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Audio Tool (Probe + Convert)")
 
-        tabs = QTabWidget()
-        tabs.addTab(ProbeTab(), "Probe")
-        tabs.addTab(ConvertTab(), "Convert")
+        self._tabs = QTabWidget()
+        self._tabs.addTab(ProbeTab(), "Probe")
+
+        # The Convert tab (widget tree, JobController, QThread wiring)
+        # is only built the first time the user actually opens it, so
+        # startup pays for one tab instead of two.
+        self._convert_placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(self._convert_placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self._convert_built = False
+        self._tabs.addTab(self._convert_placeholder, "Convert")
+        self._tabs.currentChanged.connect(self._build_convert_tab)
 
         root = QWidget()
         layout = QVBoxLayout(root)
-        layout.addWidget(tabs)
+        layout.addWidget(self._tabs)
         root.setLayout(layout)
         self.setCentralWidget(root)
-        self.resize(1100, 800)
\ No newline at end of file
+        self.resize(1100, 800)
+
+    def _build_convert_tab(self, index: int) -> None:
+        if self._convert_built:
+            return
+        if self._tabs.widget(index) is not self._convert_placeholder:
+            return
+        self._convert_built = True
+        self._convert_placeholder.layout().addWidget(ConvertTab())
\ No newline at end of file
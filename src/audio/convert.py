@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from . import dsp, kernels
+from .probe import FFprobeError, probe_file
 
 
 class FFmpegError(RuntimeError):
     pass
 
 
+# Suffixes that are clearly not media; only these are rejected before
+# ffmpeg is tried. A deny-list rather than an allow-list so unusual but
+# decodable formats (and extension-less files) still reach ffmpeg —
+# the point is only to skip the fork for files that obviously cannot
+# contain audio.
+_NON_MEDIA_SUFFIXES = {
+    ".txt", ".md", ".rtf", ".pdf", ".doc", ".docx", ".xls", ".xlsx",
+    ".csv", ".json", ".xml", ".yaml", ".yml", ".ini", ".cfg", ".toml",
+    ".log", ".html", ".htm", ".css", ".js", ".py", ".sh", ".bat",
+    ".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz",
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".svg", ".ico",
+    ".exe", ".dll", ".so", ".dylib", ".db", ".sqlite",
+}
+
+
 @dataclass(frozen=True)
 class ConvertOptions:
     out_dir: Path
@@ -18,6 +40,19 @@ class ConvertOptions:
     bit_depth: int = 16
     overwrite: bool = False
     force_wav: bool = True
+    smart_copy: bool = True
+    # Normalize to this peak amplitude (0..1) when set; needs numpy.
+    peak_normalize: Optional[float] = None
+    # Trim leading/trailing samples below trim_threshold; needs numpy.
+    trim_silence: bool = False
+    trim_threshold: float = 1e-4
+    # Called with the number of microseconds encoded so far; enables
+    # sub-file progress reporting without any extra ffmpeg cost.
+    progress_cb: Optional[Callable[[int], None]] = None
+
+    @property
+    def wants_dsp(self) -> bool:
+        return self.peak_normalize is not None or self.trim_silence
 
 
 def _pcm_codec(bit_depth: int) -> str:
@@ -27,13 +62,159 @@ def _pcm_codec(bit_depth: int) -> str:
     return m[bit_depth]
 
 
+def _matches_target(in_path: Path, opts: ConvertOptions) -> bool:
+    try:
+        info = probe_file(in_path)
+    except FFprobeError:
+        return False
+    return (
+        info.codec is not None
+        and info.codec.startswith(f"pcm_s{opts.bit_depth}")
+        and info.sample_rate == opts.sample_rate
+        and info.channels == opts.channels
+    )
+
+
+def _convert_via_dsp(in_path: Path, out_path: Path, opts: ConvertOptions) -> Path:
+    """Decode to raw s32le, quantize to s16 in-process, re-wrap as WAV.
+
+    Keeps the bit-depth reduction in a SIMD kernel instead of a second
+    ffmpeg filter stage; requires numpy (see dsp.py).
+    """
+    np = dsp.np
+
+    decode = [
+        "ffmpeg", "-v", "error",
+        "-i", str(in_path), "-vn",
+        "-ac", str(opts.channels), "-ar", str(opts.sample_rate),
+        "-f", "s32le", "pipe:1",
+    ]
+    p = subprocess.run(decode, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode != 0:
+        raise FFmpegError(p.stderr.decode(errors="replace").strip() or "ffmpeg failed")
+
+    # bytearray so the array is writable: the njit kernel's signature
+    # takes mutable arrays and numba rejects readonly ones.
+    x = np.frombuffer(bytearray(p.stdout), dtype=np.int32)
+    out = np.empty(x.size, dtype=np.int16)
+    dsp.quantize_s32_to_s16(x, out)
+
+    encode = [
+        "ffmpeg", "-y" if opts.overwrite else "-n",
+        "-f", "s16le", "-ac", str(opts.channels), "-ar", str(opts.sample_rate),
+        "-i", "pipe:0",
+        "-c:a", "pcm_s16le", str(out_path),
+    ]
+    p = subprocess.run(encode, input=out.tobytes(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode != 0:
+        raise FFmpegError(p.stderr.decode(errors="replace").strip() or "ffmpeg failed")
+    return out_path
+
+
+def _process_via_kernels(in_path: Path, out_path: Path, opts: ConvertOptions) -> Path:
+    """Decode to raw f32le, trim/normalize in-process, encode to target PCM.
+
+    One decode ffmpeg plus one encode ffmpeg per file, with the sample
+    work done by the kernels in kernels.py — no filter graph involved.
+    """
+    np = kernels.np
+
+    decode = [
+        "ffmpeg", "-v", "error",
+        "-i", str(in_path), "-vn",
+        "-ac", str(opts.channels), "-ar", str(opts.sample_rate),
+        "-f", "f32le", "pipe:1",
+    ]
+    p = subprocess.run(decode, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode != 0:
+        raise FFmpegError(p.stderr.decode(errors="replace").strip() or "ffmpeg failed")
+
+    # bytearray so the array is writable and the kernels can run in place.
+    x = np.frombuffer(bytearray(p.stdout), dtype=np.float32)
+
+    if opts.trim_silence:
+        start, end = kernels.silence_bounds_f32(x, opts.trim_threshold)
+        # Round to whole frames so interleaved channels stay aligned.
+        start -= start % opts.channels
+        end += -end % opts.channels
+        x = x[start:end]
+    if opts.peak_normalize is not None:
+        kernels.peak_norm_f32(x, opts.peak_normalize)
+
+    encode = [
+        "ffmpeg", "-y" if opts.overwrite else "-n",
+        "-f", "f32le", "-ac", str(opts.channels), "-ar", str(opts.sample_rate),
+        "-i", "pipe:0",
+        "-c:a", _pcm_codec(opts.bit_depth), str(out_path),
+    ]
+    p = subprocess.run(encode, input=x.tobytes(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode != 0:
+        raise FFmpegError(p.stderr.decode(errors="replace").strip() or "ffmpeg failed")
+    return out_path
+
+
 def convert_file(in_path: Path, opts: ConvertOptions) -> Path:
     in_path = Path(in_path)
+    if in_path.suffix.lower() in _NON_MEDIA_SUFFIXES:
+        raise FFmpegError(f"Unsupported input type: {in_path.name}")
     opts.out_dir.mkdir(parents=True, exist_ok=True)
 
     out_ext = ".wav" if opts.force_wav else in_path.suffix
     out_path = opts.out_dir / f"{in_path.stem}{out_ext}"
 
+    # An existing output newer than its input is already up to date —
+    # but only if it actually carries the requested format (the user
+    # may have changed the options since it was written), and never
+    # when DSP processing is requested, since mtime says nothing about
+    # trim/normalize having been applied. Anything else falls through
+    # to ffmpeg, whose -n keeps the explicit "file exists" error.
+    if not opts.overwrite and not opts.wants_dsp and out_ext.lower() == ".wav":
+        try:
+            up_to_date = out_path.stat().st_mtime_ns >= in_path.stat().st_mtime_ns
+        except OSError:
+            up_to_date = False
+        if up_to_date and _matches_target(out_path, opts):
+            return out_path
+
+    if opts.wants_dsp:
+        if not kernels.available:
+            raise FFmpegError("Peak normalization / silence trim requires numpy")
+        if out_ext.lower() != ".wav":
+            raise FFmpegError("Peak normalization / silence trim requires WAV output")
+        return _process_via_kernels(in_path, out_path, opts)
+
+    # If the input already is WAV in the requested format, a plain copy
+    # beats a full decode/resample/encode cycle. Deliberately a copy
+    # and not a hardlink: a shared inode would let a later re-convert
+    # with -y truncate the user's source file in place.
+    if (
+        opts.smart_copy
+        and in_path.suffix.lower() in {".wav", ".wave"}
+        and out_ext.lower() == ".wav"
+        and _matches_target(in_path, opts)
+    ):
+        if out_path.exists() and not opts.overwrite:
+            raise FFmpegError(f"Output exists: {out_path}")
+        shutil.copyfile(in_path, out_path)
+        return out_path
+
+    # Down-quantizing high-bit-depth PCM to 16-bit goes through the
+    # in-process kernel when numpy is around. The streaming-progress
+    # path keeps plain ffmpeg so the UI still gets sub-file ticks.
+    if (
+        dsp.available
+        and opts.progress_cb is None
+        and out_ext.lower() == ".wav"
+        and opts.bit_depth == 16
+        and in_path.suffix.lower() in {".wav", ".wave"}
+    ):
+        try:
+            codec = probe_file(in_path).codec or ""
+        except FFprobeError:
+            codec = ""
+        if codec in ("pcm_s24le", "pcm_s32le"):
+            return _convert_via_dsp(in_path, out_path, opts)
+
     cmd = ["ffmpeg"]
     cmd += ["-y" if opts.overwrite else "-n"]
     cmd += ["-i", str(in_path), "-vn", "-ac", str(opts.channels), "-ar", str(opts.sample_rate)]
@@ -45,14 +226,65 @@ def convert_file(in_path: Path, opts: ConvertOptions) -> Path:
 
     cmd += [str(out_path)]
 
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0:
-        raise FFmpegError(p.stderr.strip() or "ffmpeg failed")
+    if opts.progress_cb is None:
+        # Happy path: no pipes at all (ffmpeg logs go to stderr, which
+        # we would discard anyway). Only on failure is the command
+        # re-run capturing stderr to build the error message; any
+        # partial output from the first attempt is removed first so it
+        # does not mask the real error.
+        existed = out_path.exists()
+        p = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False
+        )
+        if p.returncode != 0:
+            if not existed:
+                out_path.unlink(missing_ok=True)
+            p = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False
+            )
+            if p.returncode != 0:
+                raise FFmpegError(
+                    p.stderr.decode(errors="replace").strip() or "ffmpeg failed"
+                )
+        return out_path
+
+    # Stream ffmpeg's own progress reports instead of waiting for the
+    # process to exit; -v error and -nostats keep stderr down to actual
+    # errors, and a drain thread reads it while stdout is parsed so a
+    # chatty input can never fill the stderr pipe and deadlock ffmpeg
+    # against our stdout loop.
+    cmd[1:1] = ["-v", "error", "-progress", "pipe:1", "-nostats"]
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    stderr_chunks: list[bytes] = []
+    drain = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    drain.start()
+    for line in proc.stdout:
+        key, _, value = line.strip().partition(b"=")
+        # out_time_ms is microseconds too despite its name (ffmpeg quirk);
+        # newer builds also emit out_time_us.
+        if key in (b"out_time_us", b"out_time_ms"):
+            try:
+                opts.progress_cb(int(value))
+            except ValueError:
+                pass
+    drain.join()
+    if proc.wait() != 0:
+        stderr = b"".join(stderr_chunks)
+        raise FFmpegError(stderr.decode(errors="replace").strip() or "ffmpeg failed")
     return out_path
 
 
 def convert_files(paths: list[Path], opts: ConvertOptions) -> list[Path]:
-    out: list[Path] = []
-    for p in paths:
-        out.append(convert_file(p, opts))
-    return out
\ No newline at end of file
+    if not paths:
+        return []
+    # Create the output directory once up front so the workers never race
+    # on mkdir; each conversion is an independent ffmpeg child process.
+    opts.out_dir.mkdir(parents=True, exist_ok=True)
+    workers = min(len(paths), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda p: convert_file(p, opts), paths))
\ No newline at end of file
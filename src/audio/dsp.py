@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+# Optional SIMD kernels for raw PCM buffers piped out of ffmpeg.
+#
+# numpy and numba are soft dependencies: without numpy the DSP path is
+# simply unavailable and convert falls back to plain ffmpeg; without
+# numba the kernels run as vectorized numpy, which is still far faster
+# than a per-sample Python loop.
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+    prange = range
+
+available = np is not None
+
+
+if njit is not None:
+    # Explicit signature so compilation happens at import (and lands in
+    # the on-disk cache) instead of on the first call.
+    @njit("void(int32[::1], int16[::1])", cache=True, parallel=True, fastmath=True)
+    def quantize_s32_to_s16(x, out):
+        for i in prange(x.size):
+            v = x[i] >> 16
+            out[i] = max(-32768, min(32767, v))
+
+elif np is not None:
+
+    def quantize_s32_to_s16(x, out):
+        np.clip(x >> 16, -32768, 32767, out=out, casting="unsafe")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+# DSP kernels for float32 PCM frames piped out of ffmpeg, following the
+# same soft-dependency pattern as dsp.py: numba when present (explicit
+# signatures so compilation happens at import and caches to disk),
+# vectorized numpy otherwise, unavailable without numpy.
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+    prange = range
+
+available = np is not None
+
+
+if njit is not None:
+
+    @njit("void(float32[::1], float32)", cache=True, parallel=True, fastmath=True)
+    def peak_norm_f32(x, target):
+        m = 0.0
+        for i in prange(x.size):
+            m = max(m, abs(x[i]))
+        if m == 0.0:
+            return
+        g = target / m
+        for i in prange(x.size):
+            x[i] *= g
+
+    @njit("UniTuple(int64, 2)(float32[::1], float32)", cache=True, fastmath=True)
+    def silence_bounds_f32(x, threshold):
+        start = 0
+        while start < x.size and abs(x[start]) <= threshold:
+            start += 1
+        if start == x.size:
+            return 0, 0
+        end = x.size
+        while end > start and abs(x[end - 1]) <= threshold:
+            end -= 1
+        return start, end
+
+elif np is not None:
+
+    def peak_norm_f32(x, target):
+        m = float(np.abs(x).max(initial=0.0))
+        if m == 0.0:
+            return
+        x *= target / m
+
+    def silence_bounds_f32(x, threshold):
+        idx = np.flatnonzero(np.abs(x) > threshold)
+        if idx.size == 0:
+            return 0, 0
+        return int(idx[0]), int(idx[-1]) + 1
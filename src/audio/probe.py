@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-import json
+import atexit
+import os
 import subprocess
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
+# orjson parses the ffprobe output a few times faster than stdlib json
+# and takes bytes directly; both do, so it stays a soft dependency.
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
 
 class FFprobeError(RuntimeError):
     pass
@@ -21,28 +31,152 @@ class AudioInfo:
     bit_rate: Optional[int]
 
 
-def _run(cmd: list[str]) -> str:
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+_FFPROBE_ARGS = [
+    "-v",
+    "error",
+    "-print_format",
+    "json",
+    "-show_format",
+    "-show_streams",
+]
+
+# ffprobe has no stay-open mode, so the daemon is a tiny sh loop that
+# reads one path per line from stdin, runs ffprobe on it, and marks the
+# end of each JSON document with an ASCII record separator. One daemon
+# lives per worker thread for the life of the process, so the fork+exec
+# cost of the shell is paid once instead of per file.
+_DAEMON_DRIVER = (
+    'while IFS= read -r f; do ffprobe '
+    + " ".join(_FFPROBE_ARGS)
+    + ' -- "$f" 2>/dev/null; printf \'\\n\\036\\n\'; done'
+)
+
+
+class FFProbeDaemon:
+    """A persistent sh+ffprobe loop probing one path per request."""
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            ["sh", "-c", _DAEMON_DRIVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+
+    def probe(self, path: Path) -> dict:
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        self._proc.stdin.write(os.fsencode(path) + b"\n")
+        self._proc.stdin.flush()
+        lines: list[bytes] = []
+        for line in self._proc.stdout:
+            # Note: strip() would eat \x1e (it counts as whitespace),
+            # so match the sentinel by prefix.
+            if line.startswith(b"\x1e"):
+                break
+            lines.append(line)
+        else:
+            raise OSError("ffprobe daemon exited")
+        raw = b"".join(lines).strip()
+        if not raw:
+            raise FFprobeError(f"ffprobe failed for {path}")
+        return _json.loads(raw)
+
+    def close(self) -> None:
+        try:
+            if self._proc.stdin is not None:
+                self._proc.stdin.close()
+            self._proc.terminate()
+            self._proc.wait(timeout=2)
+        except Exception:
+            pass
+
+
+_daemons: list[FFProbeDaemon] = []
+_daemons_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_daemon() -> Optional[FFProbeDaemon]:
+    if os.name != "posix":
+        return None
+    d = getattr(_local, "daemon", None)
+    if d is None:
+        try:
+            d = FFProbeDaemon()
+        except OSError:
+            return None
+        _local.daemon = d
+        with _daemons_lock:
+            _daemons.append(d)
+    return d
+
+
+@atexit.register
+def _close_daemons() -> None:
+    with _daemons_lock:
+        for d in _daemons:
+            d.close()
+        _daemons.clear()
+
+
+# Probing runs on a persistent pool so the per-thread daemons survive
+# between calls instead of being orphaned with short-lived threads.
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4, thread_name_prefix="probe"
+            )
+        return _pool
+
+
+# Probe results keyed by (realpath, mtime_ns, size) so re-probing an
+# unchanged file is a stat plus a dict lookup instead of an ffprobe run.
+# A plain dict (insertion-ordered) rather than lru_cache so the batch
+# path can insert its misses too.
+_CACHE_MAX = 4096
+_cache: dict[tuple[str, int, int], AudioInfo] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(path: Path) -> Optional[tuple[str, int, int]]:
+    try:
+        real = os.path.realpath(path)
+        st = os.stat(real)
+    except OSError:
+        return None
+    return (real, st.st_mtime_ns, st.st_size)
+
+
+def _cache_put(key: Optional[tuple[str, int, int]], info: AudioInfo) -> None:
+    if key is None:
+        return
+    with _cache_lock:
+        while len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = info
+
+
+def _run(cmd: list[str]) -> bytes:
+    # Bytes mode: json.loads accepts bytes directly, so a text-mode
+    # decode of the (potentially large) JSON would be pure overhead.
+    # close_fds=False skips the fd-closing pass; nothing sensitive is
+    # open here.
+    p = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+    )
     if p.returncode != 0:
-        raise FFprobeError(p.stderr.strip() or "ffprobe failed")
+        raise FFprobeError(p.stderr.decode(errors="replace").strip() or "ffprobe failed")
     return p.stdout
 
 
-def probe_file(path: Path) -> AudioInfo:
-    path = Path(path)
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-print_format",
-        "json",
-        "-show_format",
-        "-show_streams",
-        str(path),
-    ]
-    raw = _run(cmd)
-    data = json.loads(raw)
-
+def _parse_info(data: dict, path: Path) -> AudioInfo:
     duration = None
     fmt = data.get("format") or {}
     if "duration" in fmt:
@@ -88,8 +222,72 @@ def probe_file(path: Path) -> AudioInfo:
     )
 
 
+def _probe_uncached(path: Path) -> AudioInfo:
+    # Daemons must only live on the persistent pool's threads: a daemon
+    # created on a short-lived executor thread (the UI tabs spin one up
+    # per click) would be orphaned when that thread dies, leaking one
+    # idle sh process per thread until exit. Forward misses from any
+    # other thread onto the pool instead; pool threads run directly, so
+    # this cannot deadlock.
+    if os.name == "posix" and not threading.current_thread().name.startswith("probe_"):
+        return _get_pool().submit(_probe_uncached, path).result()
+    # The daemon protocol frames requests as one path per line; a
+    # newline inside the filename would be read as two requests and
+    # desync every later response on that daemon, so such paths take
+    # the one-shot fallback instead.
+    if b"\n" in os.fsencode(path) or b"\r" in os.fsencode(path):
+        daemon = None
+    else:
+        daemon = _get_daemon()
+    if daemon is not None:
+        try:
+            return _parse_info(daemon.probe(path), path)
+        except OSError:
+            # Daemon died (e.g. killed externally); drop it and fall
+            # through to a one-shot ffprobe.
+            _local.daemon = None
+            daemon.close()
+        except FFprobeError:
+            # The daemon discards ffprobe's stderr, so its failures are
+            # generic; re-run one-shot below to surface the actual
+            # diagnostic (one extra fork, on the error path only).
+            pass
+    cmd = ["ffprobe"] + _FFPROBE_ARGS + [str(path)]
+    raw = _run(cmd)
+    return _parse_info(_json.loads(raw), path)
+
+
+def probe_file(path: Path) -> AudioInfo:
+    path = Path(path)
+    key = _cache_key(path)
+    with _cache_lock:
+        hit = _cache.get(key) if key is not None else None
+    if hit is not None:
+        return replace(hit, path=path)
+    info = _probe_uncached(path)
+    _cache_put(key, info)
+    return info
+
+
 def probe_files(paths: list[Path]) -> list[AudioInfo]:
-    out: list[AudioInfo] = []
-    for p in paths:
-        out.append(probe_file(p))
-    return out
\ No newline at end of file
+    if not paths:
+        return []
+    paths = [Path(p) for p in paths]
+
+    # Resolve cache hits first so only the misses pay for ffprobe.
+    out: list[Optional[AudioInfo]] = [None] * len(paths)
+    misses: list[tuple[int, Path]] = []
+    for i, p in enumerate(paths):
+        key = _cache_key(p)
+        with _cache_lock:
+            hit = _cache.get(key) if key is not None else None
+        if hit is not None:
+            out[i] = replace(hit, path=p)
+        else:
+            misses.append((i, p))
+
+    if misses:
+        pool = _get_pool()
+        for (i, _), info in zip(misses, pool.map(probe_file, [p for _, p in misses])):
+            out[i] = info
+    return [info for info in out if info is not None]
\ No newline at end of file